@@ -47,7 +47,7 @@ from meshmode.array_context import (
     PyOpenCLArrayContext as _PyOpenCLArrayContextBase,
     PytatoPyOpenCLArrayContext as _PytatoPyOpenCLArrayContextBase, # This already has the parameter study capability. :)
 )
-from pytools import to_identifier
+from pytools import memoize_method, to_identifier
 from pytools.tag import Tag
 
 
@@ -280,10 +280,8 @@ class _DistributedLazilyPyOpenCLCompilingFunctionCaller(
             ) = self._dag_to_transformed_pytato_prg(
                     d, prg_id=_DistributedPartProgramID(self.f, part.pid))
 
-            assert not (set(name_in_program_to_tags.keys())
-                        & set(part_prg_name_to_tags.keys()))
-            assert not (set(name_in_program_to_axes.keys())
-                        & set(part_prg_name_to_axes.keys()))
+            assert name_in_program_to_tags.keys().isdisjoint(part_prg_name_to_tags)
+            assert name_in_program_to_axes.keys().isdisjoint(part_prg_name_to_axes)
             name_in_program_to_tags.update(part_prg_name_to_tags)
             name_in_program_to_axes.update(part_prg_name_to_axes)
 
@@ -339,6 +337,17 @@ class _DistributedCompiledFunction:
     name_in_program_to_axes: Mapping[str, tuple[pt.Axis, ...]]
     output_template: ArrayContainer
 
+    @memoize_method
+    def _output_name_to_axes_and_tags(
+            self) -> Mapping[str, tuple[tuple[Any, ...], frozenset[Tag]]]:
+        # Fixed for a given compiled function, so do not redo this on every call.
+        from arraycontext.impl.pytato.utils import get_cl_axes_from_pt_axes
+        return {
+            name: (
+                get_cl_axes_from_pt_axes(self.name_in_program_to_axes[name]),
+                self.name_in_program_to_tags[name])
+            for name in self.output_id_to_name_in_program.values()}
+
     def __call__(self, arg_id_to_arg) -> ArrayContainer:
         """
         :arg arg_id_to_arg: Mapping from input id to the passed argument. See
@@ -348,7 +357,6 @@ class _DistributedCompiledFunction:
 
         from arraycontext.impl.pyopencl.taggable_cl_array import to_tagged_cl_array
         from arraycontext.impl.pytato.compile import _args_to_device_buffers
-        from arraycontext.impl.pytato.utils import get_cl_axes_from_pt_axes
         input_args_for_prg = _args_to_device_buffers(
                 self.actx, self.input_id_to_name_in_program, arg_id_to_arg)
 
@@ -360,13 +368,13 @@ class _DistributedCompiledFunction:
                 allocator=self.actx.allocator,  # pylint: disable=no-member
                 input_args=input_args_for_prg)
 
+        output_name_to_axes_and_tags = self._output_name_to_axes_and_tags()
+
         def to_output_template(keys, _):
             ary_name_in_prg = self.output_id_to_name_in_program[keys]
+            axes, tags = output_name_to_axes_and_tags[ary_name_in_prg]
             return self.actx.thaw(to_tagged_cl_array(
-                out_dict[ary_name_in_prg],
-                axes=get_cl_axes_from_pt_axes(
-                    self.name_in_program_to_axes[ary_name_in_prg]),
-                tags=self.name_in_program_to_tags[ary_name_in_prg]))
+                out_dict[ary_name_in_prg], axes=axes, tags=tags))
 
         from arraycontext.container.traversal import rec_keyed_map_array_container
         return rec_keyed_map_array_container(to_output_template,
@@ -79,6 +79,8 @@ if TYPE_CHECKING:
 MeshOrDiscr = Mesh | Discretization
 TagToElementGroupFactory = Mapping[DiscretizationTag, ElementGroupFactory]
 
+_FACE_RESTR_TAGS = frozenset({FACE_RESTR_ALL, FACE_RESTR_INTERIOR})
+
 
 # {{{ discr_tag_to_group_factory normalization
 
@@ -277,12 +279,22 @@ class DiscretizationCollection:
             from meshmode.distributed import MPIBoundaryCommSetupHelper
             with MPIBoundaryCommSetupHelper(mpi_communicator, array_context,
                     local_boundary_connections, grp_factory) as bdry_setup_helper:
+                # Build the (memoized) interior face connections while the
+                # boundary data from our peers is in flight. Nearly every DG
+                # operator needs them, and doing this now keeps their setup
+                # cost off the first time step.
+                int_faces_tag = BoundaryDomainTag(FACE_RESTR_INTERIOR, vtag)
+                self._faces_connection(int_faces_tag)
+                self.opposite_face_connection(int_faces_tag)
+
+                # complete_some() hands back whichever peers have finished
+                # their handshake, so setup is bounded by the slowest peer
+                # rather than by the sum over peers in a fixed order.
                 while True:
                     conns = bdry_setup_helper.complete_some()
                     if not conns:
                         break
-                    for i_remote_part, conn in conns.items():
-                        boundary_connections[i_remote_part] = conn
+                    boundary_connections.update(conns)
 
         return boundary_connections
 
@@ -322,8 +334,12 @@ class DiscretizationCollection:
         """Provides a :class:`meshmode.discretization.Discretization`
         object from *dd*.
         """
-        dd = as_dofdesc(dd)
+        return self._discr_from_dd(as_dofdesc(dd))
 
+    @memoize_method
+    def _discr_from_dd(self, dd: DOFDesc) -> Discretization:
+        # Memoized on the canonical *dd*, so that e.g. ``"vol"`` and
+        # :data:`~grudge.dof_desc.DD_VOLUME_ALL` share a cache entry.
         discr_tag = dd.discretization_tag
 
         if discr_tag is DISCR_TAG_MODAL:
@@ -333,22 +349,12 @@ class DiscretizationCollection:
             return self._volume_discr_from_dd(dd)
 
         if discr_tag is not DISCR_TAG_BASE:
-            base_discr = self.discr_from_dd(dd.with_discr_tag(DISCR_TAG_BASE))
-
-            from meshmode.discretization import Discretization
-            return Discretization(
-                self._setup_actx,
-                base_discr.mesh,
-                self.group_factory_for_discretization_tag(discr_tag)
-            )
+            return self._trace_discr_from_dd(dd)
 
         assert discr_tag is DISCR_TAG_BASE
 
         if isinstance(dd.domain_tag, BoundaryDomainTag):
-            if dd.domain_tag.tag in [FACE_RESTR_ALL, FACE_RESTR_INTERIOR]:
-                return self._faces_connection(dd.domain_tag).to_discr
-            else:
-                return self._boundary_connection(dd.domain_tag).to_discr
+            return self._trace_connection(dd.domain_tag).to_discr
         else:
             raise ValueError(f"DOF desc not understood: {dd}")
 
@@ -359,7 +365,7 @@ class DiscretizationCollection:
     @memoize_method
     def _has_affine_groups(self, domain_tag: DomainTag) -> bool:
         from modepy.shapes import Simplex
-        discr = self.discr_from_dd(DOFDesc(domain_tag, DISCR_TAG_BASE))
+        discr = self._discr_from_dd(DOFDesc(domain_tag, DISCR_TAG_BASE))
         return any(
                 megrp.is_affine
                 and issubclass(cast(ModepyElementGroup, megrp).shape_cls, Simplex)
@@ -378,7 +384,7 @@ class DiscretizationCollection:
         This is an internal function, not intended for use outside
         :mod:`grudge`.
         """
-        base_discr = self.discr_from_dd(dd)
+        base_discr = self._discr_from_dd(dd)
         if not self._has_affine_groups(dd.domain_tag):
             # no benefit to having another discretization that takes
             # advantage of affine-ness
@@ -432,9 +438,11 @@ class DiscretizationCollection:
         :arg to_dd: a :class:`~grudge.dof_desc.DOFDesc`, or a value
             convertible to one.
         """
-        from_dd = as_dofdesc(from_dd)
-        to_dd = as_dofdesc(to_dd)
+        return self._connection_from_dds(as_dofdesc(from_dd), as_dofdesc(to_dd))
 
+    @memoize_method
+    def _connection_from_dds(
+            self, from_dd: DOFDesc, to_dd: DOFDesc) -> DiscretizationConnection:
         to_discr_tag = to_dd.discretization_tag
         from_discr_tag = from_dd.discretization_tag
 
@@ -457,7 +465,7 @@ class DiscretizationCollection:
                 and from_discr_tag == to_discr_tag
                 and isinstance(to_dd.domain_tag, BoundaryDomainTag)
                 and to_dd.domain_tag.tag is FACE_RESTR_ALL):
-            faces_conn = self.connection_from_dds(
+            faces_conn = self._connection_from_dds(
                     DOFDesc(
                         VolumeDomainTag(from_dd.domain_tag.volume_tag),
                         DISCR_TAG_BASE),
@@ -471,8 +479,8 @@ class DiscretizationCollection:
 
             return make_face_to_all_faces_embedding(
                     self._setup_actx,
-                    faces_conn, self.discr_from_dd(to_dd),
-                    self.discr_from_dd(from_dd))
+                    faces_conn, self._discr_from_dd(to_dd),
+                    self._discr_from_dd(from_dd))
 
         # {{{ simplify domain + discr_tag change into chained
 
@@ -487,12 +495,12 @@ class DiscretizationCollection:
             return ChainedDiscretizationConnection(
                     [
                         # first change domain
-                        self.connection_from_dds(
+                        self._connection_from_dds(
                             from_dd,
                             intermediate_dd),
 
                         # then go to quad grid
-                        self.connection_from_dds(
+                        self._connection_from_dds(
                             intermediate_dd,
                             to_dd
                             )])
@@ -512,8 +520,8 @@ class DiscretizationCollection:
 
             return make_same_mesh_connection(
                     self._setup_actx,
-                    self.discr_from_dd(to_dd),
-                    self.discr_from_dd(from_dd))
+                    self._discr_from_dd(to_dd),
+                    self._discr_from_dd(from_dd))
 
         # }}}
 
@@ -530,11 +538,7 @@ class DiscretizationCollection:
                             f"('{from_dd.domain_tag.tag}') "
                             "to the boundary of another volume "
                             f"('{to_dd.domain_tag.volume_tag}') ")
-                if to_dd.domain_tag.tag in [FACE_RESTR_ALL, FACE_RESTR_INTERIOR]:
-                    return self._faces_connection(to_dd.domain_tag)
-                elif isinstance(to_dd.domain_tag, BoundaryDomainTag):
-                    assert from_discr_tag is DISCR_TAG_BASE
-                    return self._boundary_connection(to_dd.domain_tag)
+                return self._trace_connection(to_dd.domain_tag)
             elif to_dd.is_volume():
                 if to_dd.domain_tag != from_dd.domain_tag:
                     raise ValueError("cannot get a connection between "
@@ -588,11 +592,24 @@ class DiscretizationCollection:
             self.group_factory_for_discretization_tag(dd.discretization_tag)
         )
 
+    def _trace_discr_from_dd(self, dd: DOFDesc) -> Discretization:
+        assert not dd.is_volume()
+        assert dd.discretization_tag is not DISCR_TAG_BASE
+
+        base_discr = self._discr_from_dd(dd.with_discr_tag(DISCR_TAG_BASE))
+
+        from meshmode.discretization import Discretization
+        return Discretization(
+            self._setup_actx,
+            base_discr.mesh,
+            self.group_factory_for_discretization_tag(dd.discretization_tag)
+        )
+
     @memoize_method
     def _modal_discr(self, domain_tag) -> Discretization:
         from meshmode.discretization import Discretization
 
-        discr_base = self.discr_from_dd(DOFDesc(domain_tag, DISCR_TAG_BASE))
+        discr_base = self._discr_from_dd(DOFDesc(domain_tag, DISCR_TAG_BASE))
         return Discretization(
             self._setup_actx, discr_base.mesh,
             self.group_factory_for_discretization_tag(DISCR_TAG_MODAL)
@@ -615,7 +632,7 @@ class DiscretizationCollection:
 
         return ModalToNodalDiscretizationConnection(
             from_discr=self._modal_discr(to_dd.domain_tag),
-            to_discr=self.discr_from_dd(to_dd)
+            to_discr=self._discr_from_dd(to_dd)
         )
 
     @memoize_method
@@ -631,7 +648,7 @@ class DiscretizationCollection:
         )
 
         return NodalToModalDiscretizationConnection(
-            from_discr=self.discr_from_dd(from_dd),
+            from_discr=self._discr_from_dd(from_dd),
             to_discr=self._modal_discr(from_dd.domain_tag)
         )
 
@@ -639,6 +656,13 @@ class DiscretizationCollection:
 
     # {{{ connection factories: boundary
 
+    def _trace_connection(
+            self, domain_tag: BoundaryDomainTag) -> DiscretizationConnection:
+        if domain_tag.tag in _FACE_RESTR_TAGS:
+            return self._faces_connection(domain_tag)
+        else:
+            return self._boundary_connection(domain_tag)
+
     @memoize_method
     def _boundary_connection(
             self, domain_tag: BoundaryDomainTag) -> DiscretizationConnection:
@@ -656,7 +680,7 @@ class DiscretizationCollection:
     @memoize_method
     def _faces_connection(
             self, domain_tag: BoundaryDomainTag) -> DiscretizationConnection:
-        assert domain_tag.tag in [FACE_RESTR_INTERIOR, FACE_RESTR_ALL]
+        assert domain_tag.tag in _FACE_RESTR_TAGS
 
         return make_face_restriction(
             self._setup_actx,
@@ -691,24 +715,31 @@ class DiscretizationCollection:
 
     # {{{ properties
 
+    # The volume discretizations are fixed at construction, so these are
+    # computed once on first access.
+
     @property
+    @memoize_method
     def dim(self) -> int:
         """Return the topological dimension."""
         return single_valued(discr.dim for discr in self._volume_discrs.values())
 
     @property
+    @memoize_method
     def ambient_dim(self) -> int:
         """Return the dimension of the ambient space."""
         return single_valued(
                 discr.ambient_dim for discr in self._volume_discrs.values())
 
     @property
+    @memoize_method
     def real_dtype(self) -> "np.dtype[Any]":
         """Return the data type used for real-valued arithmetic."""
         return single_valued(
                 discr.real_dtype for discr in self._volume_discrs.values())
 
     @property
+    @memoize_method
     def complex_dtype(self) -> "np.dtype[Any]":
         """Return the data type used for complex-valued arithmetic."""
         return single_valued(
@@ -78,7 +78,7 @@ THE SOFTWARE.
 
 from collections.abc import Hashable
 from dataclasses import dataclass, replace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 from meshmode.discretization.connection import FACE_RESTR_ALL, FACE_RESTR_INTERIOR
@@ -89,7 +89,7 @@ from meshmode.mesh import (
     BTAG_REALLY_ALL,
     BoundaryTag,
 )
-from pytools import to_identifier
+from pytools import memoize, to_identifier
 
 
 # {{{ volume tags
@@ -143,6 +143,10 @@ class BoundaryDomainTag:
 
 DomainTag = ScalarDomainTag | VolumeDomainTag | BoundaryDomainTag
 
+# A plain tuple for the hot isinstance checks, which is cheaper to test
+# against than the union above.
+_DOMAIN_TAG_TYPES = (ScalarDomainTag, VolumeDomainTag, BoundaryDomainTag)
+
 # }}}
 
 
@@ -228,16 +232,22 @@ class DOFDesc:
     .. automethod:: as_identifier
     """
 
+    __slots__ = ("_hash", "discretization_tag", "domain_tag")
+
     domain_tag: DomainTag
     discretization_tag: DiscretizationTag
 
+    if TYPE_CHECKING:
+        # Set lazily by __hash__. Declared here so that dataclass does not
+        # turn it into a field.
+        _hash: int
+
     def __init__(self,
             domain_tag: Any,
             discretization_tag: DiscretizationTag | None = None) -> None:
 
         if (
-                not isinstance(domain_tag,
-                               ScalarDomainTag | BoundaryDomainTag | VolumeDomainTag)
+                not isinstance(domain_tag, _DOMAIN_TAG_TYPES)
                 or discretization_tag is None
                 or (
                     not isinstance(discretization_tag, type)
@@ -253,6 +263,26 @@ class DOFDesc:
         object.__setattr__(self, "domain_tag", domain_tag)
         object.__setattr__(self, "discretization_tag", discretization_tag)
 
+    def __hash__(self) -> int:
+        # DOFDescs are used as (memoization) dictionary keys all over the
+        # place, so only hash the tags once.
+        try:
+            return self._hash
+        except AttributeError:
+            result = hash((self.domain_tag, self.discretization_tag))
+            object.__setattr__(self, "_hash", result)
+            return result
+
+    def __getstate__(self):
+        # Do not pickle the cached hash: class-valued tags hash differently
+        # in different processes.
+        return (self.domain_tag, self.discretization_tag)
+
+    def __setstate__(self, state) -> None:
+        domain_tag, discretization_tag = state
+        object.__setattr__(self, "domain_tag", domain_tag)
+        object.__setattr__(self, "discretization_tag", discretization_tag)
+
     def is_scalar(self) -> bool:
         return isinstance(self.domain_tag, ScalarDomainTag)
 
@@ -397,7 +427,7 @@ def _normalize_domain_and_discr_tag(
 
     if domain == "scalar":
         domain = DTAG_SCALAR
-    elif isinstance(domain, ScalarDomainTag | BoundaryDomainTag | VolumeDomainTag):
+    elif isinstance(domain, _DOMAIN_TAG_TYPES):
         pass
     elif domain in [VTAG_ALL, "vol"]:
         domain = DTAG_VOLUME_ALL
@@ -453,12 +483,39 @@ def as_dofdesc(
     if isinstance(domain, DOFDesc):
         return domain
 
+    try:
+        hash((domain, discretization_tag, _contextual_volume_tag))
+    except TypeError:
+        # *domain* is unhashable, and so cannot be looked up in the cache.
+        # Let normalization deal with it (and most likely complain).
+        return _make_dofdesc_uncached(
+                domain, discretization_tag, _contextual_volume_tag)
+
+    return _make_dofdesc(domain, discretization_tag, _contextual_volume_tag)
+
+
+def _make_dofdesc_uncached(
+        domain: "ConvertibleToDOFDesc",
+        discretization_tag: DiscretizationTag | None,
+        contextual_volume_tag: VolumeTag | None) -> DOFDesc:
     domain, discretization_tag = _normalize_domain_and_discr_tag(
             domain, discretization_tag,
-            _contextual_volume_tag=_contextual_volume_tag)
+            _contextual_volume_tag=contextual_volume_tag)
 
     return DOFDesc(domain, discretization_tag)
 
+
+@memoize
+def _make_dofdesc(
+        domain: "ConvertibleToDOFDesc",
+        discretization_tag: DiscretizationTag | None,
+        contextual_volume_tag: VolumeTag | None) -> DOFDesc:
+    # Only a handful of distinct tags occur in practice, but as_dofdesc is
+    # called with them all over the place. Since DOFDesc is immutable, share
+    # the normalized instances instead of redoing the normalization each time.
+    return _make_dofdesc_uncached(
+            domain, discretization_tag, contextual_volume_tag)
+
 # }}}
 
 
@@ -147,7 +147,8 @@ def dt_non_geometric_factors(
     for grp in discr.groups:
         assert isinstance(grp, NodalElementGroupBase)
 
-        nodes = np.asarray(list(zip(*grp.unit_nodes, strict=True)))
+        # shape: (nunit_dofs, dim)
+        nodes = grp.unit_nodes.T
         nnodes = grp.nunit_dofs
 
         # NOTE: order 0 elements have 1 node located at the centroid of
@@ -160,11 +161,10 @@ def dt_non_geometric_factors(
                 )
             )
         else:
+            # distances are symmetric, so only look at each pair once
+            i, j = np.triu_indices(nnodes, k=1)
             min_delta_rs.append(
-                min(
-                    float(np.linalg.norm(nodes[i] - nodes[j]))
-                    for i in range(nnodes) for j in range(nnodes) if i != j
-                )
+                float(np.min(np.linalg.norm(nodes[i] - nodes[j], axis=-1)))
             )
 
     return min_delta_rs
@@ -58,6 +58,9 @@ THE SOFTWARE.
 """
 
 
+from functools import reduce
+from operator import xor as outerprod_op
+
 import numpy as np
 
 from arraycontext import ArrayContext, register_multivector_as_array_container, tag_axes
@@ -167,10 +170,12 @@ def forward_metric_nth_derivative(
 
     from meshmode.discretization import num_reference_derivative
 
+    # Only thaw the coordinate component that is being differentiated.
+    inner_discr = dcoll.discr_from_dd(inner_dd)
     vec = num_reference_derivative(
-        dcoll.discr_from_dd(inner_dd),
+        inner_discr,
         flat_ref_axes,
-        actx.thaw(dcoll.discr_from_dd(inner_dd).nodes())[xyz_axis]
+        actx.thaw(inner_discr.nodes()[xyz_axis])
     )
 
     return _geometry_to_quad_if_requested(
@@ -262,7 +267,8 @@ def forward_metric_derivative_mat(
 
     dim = dcoll.discr_from_dd(dd).dim
 
-    result = np.zeros((ambient_dim, dim), dtype=object)
+    # Every column is filled in below.
+    result = np.empty((ambient_dim, dim), dtype=object)
     for j in range(dim):
         result[:, j] = forward_metric_derivative_vector(
             actx, dcoll, j, dd=dd,
@@ -327,13 +333,39 @@ def inverse_metric_derivative_mat(
 
     dim = dcoll.discr_from_dd(dd).dim
 
-    result = np.zeros((ambient_dim, dim), dtype=object)
-    for i in range(dim):
-        for j in range(ambient_dim):
-            result[i, j] = inverse_metric_derivative(
-                actx, dcoll, i, j, dd=dd,
-                _use_geoderiv_connection=_use_geoderiv_connection
-            )
+    # Shared by all entries, so only compute these once.
+    par_vecs, volume_pseudoscalar_inv = _par_vecs_and_pseudoscalar_inv(
+        actx, dcoll, dd, _use_geoderiv_connection=_use_geoderiv_connection)
+
+    # Cramer's rule replaces one of the parallelepiped vectors with a unit
+    # vector, so the wedge products of the vectors before and after it can
+    # be shared between all entries in the same row.
+    prefixes: list[MultiVector | None] = [None]
+    for vec in par_vecs[:-1]:
+        prefix = prefixes[-1]
+        prefixes.append(vec if prefix is None else outerprod_op(prefix, vec))
+
+    suffixes: list[MultiVector | None] = [None]
+    for vec in par_vecs[:0:-1]:
+        suffix = suffixes[-1]
+        suffixes.append(vec if suffix is None else outerprod_op(vec, suffix))
+    suffixes.reverse()
+
+    basis_mvs: list[MultiVector] = [
+        MultiVector(unit_vec) for unit_vec in np.eye(ambient_dim)]
+
+    from itertools import product
+
+    result = np.empty((ambient_dim, dim), dtype=object)
+    for i, j in product(range(dim), range(ambient_dim)):
+        wedge = basis_mvs[j]
+        prefix, suffix = prefixes[i], suffixes[i]
+        if prefix is not None:
+            wedge = outerprod_op(prefix, wedge)
+        if suffix is not None:
+            wedge = outerprod_op(wedge, suffix)
+
+        result[i, j] = (wedge * volume_pseudoscalar_inv).as_scalar()
 
     return result
 
@@ -408,7 +440,17 @@ def inverse_metric_derivative(
     :returns: a :class:`~meshmode.dof_array.DOFArray` containing the
         inverse metric derivative at each nodal coordinate.
     """
+    par_vecs, volume_pseudoscalar_inv = _par_vecs_and_pseudoscalar_inv(
+        actx, dcoll, dd, _use_geoderiv_connection=_use_geoderiv_connection)
+
+    return _inverse_metric_derivative_from_par_vecs(
+        par_vecs, volume_pseudoscalar_inv, rst_axis, xyz_axis)
+
 
+def _par_vecs_and_pseudoscalar_inv(
+        actx: ArrayContext, dcoll: DiscretizationCollection, dd: DOFDesc,
+        *, _use_geoderiv_connection=False
+        ) -> tuple[list[MultiVector], MultiVector]:
     dim = dcoll.dim
     if dim != dcoll.ambient_dim:
         raise ValueError(
@@ -422,31 +464,21 @@ def inverse_metric_derivative(
                 _use_geoderiv_connection=_use_geoderiv_connection)
             for rst in range(dim)]
 
-    # Yay Cramer's rule!
-    from functools import partial, reduce
-    from operator import xor as outerprod_op
-    outerprod = partial(reduce, outerprod_op)
+    return par_vecs, reduce(outerprod_op, par_vecs).inv()
 
-    def outprod_with_unit(i, at):
-        unit_vec = np.zeros(dim)
-        unit_vec[i] = 1
 
-        vecs = par_vecs[:]
-        vecs[at] = MultiVector(unit_vec)
+def _inverse_metric_derivative_from_par_vecs(
+        par_vecs: list[MultiVector], volume_pseudoscalar_inv: MultiVector,
+        rst_axis: int, xyz_axis: int) -> DOFArray:
+    # Yay Cramer's rule!
+    dim = len(par_vecs)
+    unit_vec = np.zeros(dim)
+    unit_vec[xyz_axis] = 1
 
-        return outerprod(vecs)
+    vecs = list(par_vecs)
+    vecs[rst_axis] = MultiVector(unit_vec)
 
-    volume_pseudoscalar_inv = outerprod(
-        forward_metric_derivative_mv(
-            actx, dcoll, rst_axis, dd,
-            _use_geoderiv_connection=_use_geoderiv_connection)
-        for rst_axis in range(dim)
-    ).inv()
-
-    result = (outprod_with_unit(xyz_axis, rst_axis)
-              * volume_pseudoscalar_inv).as_scalar()
-
-    return result
+    return (reduce(outerprod_op, vecs) * volume_pseudoscalar_inv).as_scalar()
 
 
 def inverse_surface_metric_derivative(
@@ -527,13 +559,23 @@ def inverse_surface_metric_derivative_mat(
         else:
             multiplier = 1
 
+        # Build all entries at once (rather than calling
+        # inverse_surface_metric_derivative per entry), so that terms shared
+        # between entries are only computed once.
+        if dcoll.ambient_dim == dcoll.dim:
+            inv_mder = inverse_metric_derivative_mat(
+                actx, dcoll, dd=dd,
+                _use_geoderiv_connection=_use_geoderiv_connection)
+        else:
+            inv_form1 = inverse_first_fundamental_form(actx, dcoll, dd=dd)
+            inv_mder = inv_form1.dot(
+                forward_metric_derivative_mat(
+                    actx, dcoll, dd=dd,
+                    _use_geoderiv_connection=_use_geoderiv_connection).T)
+
         mat = actx.np.stack([
             actx.np.stack([
-                multiplier
-                * inverse_surface_metric_derivative(
-                    actx, dcoll,
-                    rst_axis, xyz_axis, dd=dd,
-                    _use_geoderiv_connection=_use_geoderiv_connection)
+                multiplier * inv_mder[rst_axis, xyz_axis]
                 for rst_axis in range(dcoll.dim)])
             for xyz_axis in range(dcoll.ambient_dim)])
 
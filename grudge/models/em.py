@@ -65,8 +65,7 @@ def is_zero(x):
 
 
 def count_subset(subset):
-    from pytools import len_iterable
-    return len_iterable(uc for uc in subset if uc)
+    return sum(1 for uc in subset if uc)
 
 
 def partial_to_all_subset_indices(subsets, base=0):
@@ -388,15 +387,7 @@ class MaxwellOperator(HyperbolicOperator):
         Combines the relevant operator templates for spatial
         derivatives, flux, boundary conditions etc.
         """
-        elec_components = count_subset(self.get_eh_subset()[0:3])
-        mag_components = count_subset(self.get_eh_subset()[3:6])
-
-        if self.fixed_material:
-            # need to check this
-            material_divisor = (
-                    [self.epsilon]*elec_components+[self.mu]*mag_components)
-        else:
-            raise NotImplementedError("only fixed material supported for now")
+        material_divisor = self._material_divisor()
 
         tags_and_bcs = [
                 (self.pec_tag, self.pec_bc(w)),
@@ -425,6 +416,20 @@ class MaxwellOperator(HyperbolicOperator):
             )
         ) / material_divisor
 
+    @memoize_method
+    def _material_divisor(self):
+        """Return the per-component material coefficients by which the
+        operator is divided, in field order.
+        """
+        elec_components = count_subset(self.get_eh_subset()[0:3])
+        mag_components = count_subset(self.get_eh_subset()[3:6])
+
+        if self.fixed_material:
+            # need to check this
+            return [self.epsilon]*elec_components+[self.mu]*mag_components
+        else:
+            raise NotImplementedError("only fixed material supported for now")
+
     @memoize_method
     def partial_to_eh_subsets(self):
         """Helps find the indices of the E and H components, which can vary
@@ -60,7 +60,7 @@ from pytools.obj_array import make_obj_array
 import grudge.geometry as geo
 import grudge.op as op
 from grudge.discretization import DiscretizationCollection
-from grudge.dof_desc import DISCR_TAG_BASE, DOFDesc, as_dofdesc
+from grudge.dof_desc import DD_VOLUME_ALL, DOFDesc, as_dofdesc
 from grudge.models import HyperbolicOperator
 from grudge.trace_pair import TracePair
 
@@ -182,11 +182,9 @@ class PrescribedBC(InviscidBCObject):
             dcoll: DiscretizationCollection,
             dd_bc: DOFDesc,
             state: ConservedEulerField, t=0):
-        dd_base = as_dofdesc("vol", DISCR_TAG_BASE)
-
         return TracePair(
             dd_bc,
-            interior=op.project(dcoll, dd_base, dd_bc, state),
+            interior=op.project(dcoll, DD_VOLUME_ALL, dd_bc, state),
             exterior=self.prescribed_state(actx.thaw(dcoll.nodes(dd_bc)), t=t)
         )
 
@@ -199,9 +197,8 @@ class InviscidWallBC(InviscidBCObject):
             dcoll: DiscretizationCollection,
             dd_bc: DOFDesc,
             state: ConservedEulerField, t=0):
-        dd_base = as_dofdesc("vol", DISCR_TAG_BASE)
         nhat = geo.normal(actx, dcoll, dd_bc)
-        interior = op.project(dcoll, dd_base, dd_bc, state)
+        interior = op.project(dcoll, DD_VOLUME_ALL, dd_bc, state)
 
         return TracePair(
             dd_bc,
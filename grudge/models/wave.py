@@ -33,7 +33,7 @@ from pytools.obj_array import flat_obj_array
 
 import grudge.geometry as geo
 import grudge.op as op
-from grudge.dof_desc import DISCR_TAG_BASE, as_dofdesc
+from grudge.dof_desc import DD_VOLUME_ALL
 from grudge.models import HyperbolicOperator
 
 
@@ -112,8 +112,6 @@ class WeakWaveOperator(HyperbolicOperator):
         v = w[1:]
         actx = u.array_context
 
-        base_dd = as_dofdesc("vol", DISCR_TAG_BASE)
-
         # boundary conditions -------------------------------------------------
 
         # dirichlet BCs -------------------------------------------------------
@@ -162,11 +160,11 @@ class WeakWaveOperator(HyperbolicOperator):
                     sum(flux(tpair) for tpair in op.interior_trace_pairs(
                         dcoll, w, comm_tag=self.comm_tag))
                     + flux(op.bv_trace_pair(
-                            dcoll, base_dd.trace(self.dirichlet_tag), w, dir_bc))
+                            dcoll, DD_VOLUME_ALL.trace(self.dirichlet_tag), w, dir_bc))
                     + flux(op.bv_trace_pair(
-                            dcoll, base_dd.trace(self.neumann_tag), w, neu_bc))
+                            dcoll, DD_VOLUME_ALL.trace(self.neumann_tag), w, neu_bc))
                     + flux(op.bv_trace_pair(
-                            dcoll, base_dd.trace(self.radiation_tag), w, rad_bc))
+                            dcoll, DD_VOLUME_ALL.trace(self.radiation_tag), w, rad_bc))
                 )
             )
         )
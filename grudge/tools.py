@@ -222,7 +222,7 @@ def rec_map_subarrays(
             isinstance(a, np.ndarray)
             and (
                 a.dtype != object
-                or all(is_scalar(a[idx]) for idx in np.ndindex(a.shape))))
+                or all(is_scalar(entry) for entry in a.flat)))
 
     if is_scalar(ary) or is_array_of_scalars(ary):
         return map_subarrays(
@@ -88,7 +88,7 @@ from arraycontext import (
     with_container_arithmetic,
 )
 from meshmode.mesh import BTAG_PARTITION, PartID
-from pytools import memoize_on_first_arg
+from pytools import memoize, memoize_on_first_arg
 from pytools.persistent_dict import Hash, KeyBuilder
 
 import grudge.dof_desc as dof_desc
@@ -133,6 +133,8 @@ class TracePair:
     .. automethod:: __len__
     """
 
+    __slots__ = ("__weakref__", "dd", "exterior", "interior")
+
     dd: DOFDesc
     interior: ArrayContainer
     exterior: ArrayContainer
@@ -152,10 +154,28 @@ class TracePair:
         object.__setattr__(self, "interior", interior)
         object.__setattr__(self, "exterior", exterior)
 
+    def __getstate__(self):
+        return (self.dd, self.interior, self.exterior)
+
+    def __setstate__(self, state) -> None:
+        # The default slot restoration goes through the frozen __setattr__.
+        dd, interior, exterior = state
+        object.__setattr__(self, "dd", dd)
+        object.__setattr__(self, "interior", interior)
+        object.__setattr__(self, "exterior", exterior)
+
     def __getattr__(self, name):
         """Return a new :class:`TracePair` resulting from executing attribute
         lookup with *name* on :attr:`int` and :attr:`ext`.
         """
+        if name in TracePair.__slots__ or (
+                name.startswith("__") and name.endswith("__")):
+            # An unset slot (e.g. while unpickling) must not recurse into
+            # this method through self.dd below. Protocol lookups such as
+            # __dict__ or __deepcopy__ are about the pair itself, and must
+            # not be forwarded to the members.
+            raise AttributeError(name)
+
         return TracePair(self.dd,
                          interior=getattr(self.interior, name),
                          exterior=getattr(self.exterior, name))
@@ -283,6 +303,13 @@ def bv_trace_pair(
 
 # {{{ interior trace pairs
 
+@memoize
+def _interior_faces_dd(volume_dd: DOFDesc) -> DOFDesc:
+    # Called for every interior trace pair (i.e. several times per RHS
+    # evaluation) with the same few volume descriptors.
+    return volume_dd.trace(FACE_RESTR_INTERIOR)
+
+
 def local_interior_trace_pair(
         dcoll: DiscretizationCollection, vec, *,
         volume_dd: DOFDesc | None = None,
@@ -307,7 +334,7 @@ def local_interior_trace_pair(
         volume_dd = DD_VOLUME_ALL
 
     assert isinstance(volume_dd.domain_tag, VolumeDomainTag)
-    trace_dd = volume_dd.trace(FACE_RESTR_INTERIOR)
+    trace_dd = _interior_faces_dd(volume_dd)
 
     interior = project(dcoll, volume_dd, trace_dd, vec)
 
@@ -376,6 +403,9 @@ class _TagKeyBuilder(KeyBuilder):
         self.rec(key_hash, (key.__module__, key.__name__, key.__name__,))
 
 
+_TAG_KEY_BUILDER = _TagKeyBuilder()
+
+
 @memoize_on_first_arg
 def connected_parts(
         dcoll: DiscretizationCollection,
@@ -397,6 +427,14 @@ def _sym_tag_to_num_tag(comm_tag: Hashable | None) -> int | None:
     if isinstance(comm_tag, int):
         return comm_tag
 
+    return _hash_sym_tag_to_num_tag(comm_tag)
+
+
+@memoize
+def _hash_sym_tag_to_num_tag(comm_tag: Hashable) -> int:
+    # Memoized: the same symbolic tags recur on every exchange (i.e. every
+    # time step), and digesting them is not free.
+
     # FIXME: This isn't guaranteed to be correct.
     # See here for discussion:
     # - https://github.com/illinois-ceesd/mirgecom/issues/617#issuecomment-1057082716  # noqa
@@ -405,8 +443,7 @@ def _sym_tag_to_num_tag(comm_tag: Hashable | None) -> int | None:
     from mpi4py import MPI
     tag_ub = MPI.COMM_WORLD.Get_attr(MPI.TAG_UB)
     assert tag_ub is not None
-    key_builder = _TagKeyBuilder()
-    digest = key_builder(comm_tag)
+    digest = _TAG_KEY_BUILDER(comm_tag)
 
     num_tag = sum(ord(ch) << i for i, ch in enumerate(digest)) % tag_ub
 
@@ -604,7 +641,7 @@ def cross_rank_trace_pairs(
         return [TracePair(
                 volume_dd.trace(BTAG_PARTITION(remote_rank)),
                 interior=ary, exterior=ary)
-            for remote_rank in connected_parts(dcoll, volume_dd=volume_dd)]
+            for remote_rank in connected_parts(dcoll, volume_dd)]
 
     actx = get_container_context_recursively(ary)
 
@@ -617,7 +654,7 @@ def cross_rank_trace_pairs(
     else:
         rbc_class = _RankBoundaryCommunicationEager
 
-    cparts = connected_parts(dcoll, volume_dd=volume_dd)
+    cparts = connected_parts(dcoll, volume_dd)
 
     if not cparts:
         return []
@@ -1213,6 +1213,37 @@ def test_multiple_independent_volumes(actx_factory):
 # }}}
 
 
+# {{{ DOF descriptors
+
+def test_as_dofdesc_shares_instances():
+    assert dof_desc.as_dofdesc("vol") is dof_desc.as_dofdesc("vol")
+    assert (
+        dof_desc.as_dofdesc("vol", dof_desc.DISCR_TAG_QUAD)
+        is dof_desc.as_dofdesc("vol", dof_desc.DISCR_TAG_QUAD))
+
+    # unhashable domains bypass the cache, but must still be rejected
+    with pytest.raises(ValueError):
+        dof_desc.as_dofdesc([1])
+
+
+def test_dofdesc_pickle():
+    from pickle import dumps, loads
+
+    from meshmode.mesh import BTAG_ALL
+
+    for dd in [
+            dof_desc.DD_VOLUME_ALL,
+            dof_desc.as_dofdesc(BTAG_ALL, dof_desc.DISCR_TAG_QUAD)]:
+        hash(dd)
+        dd2 = loads(dumps(dd))
+
+        assert dd2 == dd
+        assert hash(dd2) == hash(dd)
+        assert {dd: 1}[dd2] == 1
+
+# }}}
+
+
 # You can test individual routines by typing
 # $ python test_grudge.py 'test_routine()'
 
@@ -71,3 +71,24 @@ def test_trace_pair(actx_factory):
     assert op.norm(dcoll, tpair.diff - (exterior - interior), np.inf) == 0
     assert op.norm(dcoll, tpair.int - interior, np.inf) == 0
     assert op.norm(dcoll, tpair.ext - exterior, np.inf) == 0
+
+
+def test_trace_pair_pickle():
+    from copy import copy, deepcopy
+    from pickle import dumps, loads
+    from weakref import ref
+
+    from grudge.dof_desc import DD_VOLUME_ALL
+    interior = np.arange(4.0)
+    exterior = -np.arange(4.0)
+    tpair = TracePair(DD_VOLUME_ALL, interior=interior, exterior=exterior)
+
+    for tpair2 in [loads(dumps(tpair)), deepcopy(tpair), copy(tpair)]:
+        assert tpair2.dd == DD_VOLUME_ALL
+        assert np.array_equal(tpair2.int, interior)
+        assert np.array_equal(tpair2.ext, exterior)
+
+    assert ref(tpair)() is tpair
+
+    # no instance __dict__, and it must not be forwarded to int/ext
+    assert not hasattr(tpair, "__dict__")